@@ -1,30 +1,55 @@
 import hashlib
+import threading
 import time
+from collections import OrderedDict
 
 class CacheManager:
     """
-    Простая реализация кэша: словарь query_hash -> (timestamp, result).
-    Можно расширять до продвинутых методов (LRU, ограничение по памяти и т.д.).
+    Кэш результатов: словарь query_hash -> (timestamp, result).
+    Результат хранится уже закодированным в байты (в том виде, в каком уходит клиенту),
+    объём кэша учитывается в байтах и ограничен max_bytes: при переполнении
+    вытесняются давно не использованные записи (LRU).
+    Один экземпляр разделяется между всеми клиентами сервера, поэтому доступ
+    защищён блокировкой.
     """
-    def __init__(self, ttl=60):
+    def __init__(self, ttl=60, max_bytes=64 * 1024 * 1024):
         self.ttl = ttl
-        self.cache = {}  # {hash: (time, result)}
+        self.max_bytes = max_bytes
+        self.cache = OrderedDict()  # {hash: (time, result)}
+        self.size_bytes = 0  # Суммарный размер хранимых результатов
+        self.lock = threading.Lock()
 
     def get_from_cache(self, query_info: dict):
         # Формируем ключ (хэш) на основе query_info
         key = self._make_key(query_info)
-        if key in self.cache:
-            timestamp, result = self.cache[key]
-            if time.time() - timestamp < self.ttl:
-                return result
-            else:
-                # устарело
-                del self.cache[key]
+        with self.lock:
+            if key in self.cache:
+                timestamp, result = self.cache[key]
+                if time.time() - timestamp < self.ttl:
+                    self.cache.move_to_end(key)
+                    return result
+                else:
+                    # устарело
+                    self._remove(key)
         return None
 
-    def save_to_cache(self, query_info: dict, result: str):
+    def save_to_cache(self, query_info: dict, result: bytes):
         key = self._make_key(query_info)
-        self.cache[key] = (time.time(), result)
+        if len(result) > self.max_bytes:
+            # Результат больше всего кэша — не храним его
+            return
+        with self.lock:
+            if key in self.cache:
+                self._remove(key)
+            self.cache[key] = (time.time(), result)
+            self.size_bytes += len(result)
+            # Вытесняем самые старые записи, пока не уложимся в лимит
+            while self.size_bytes > self.max_bytes:
+                self._remove(next(iter(self.cache)))
+
+    def _remove(self, key: str):
+        _, result = self.cache.pop(key)
+        self.size_bytes -= len(result)
 
     def _make_key(self, query_info: dict) -> str:
         # Сериализуем dict в строку и берём хэш
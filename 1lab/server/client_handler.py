@@ -13,7 +13,7 @@ class ClientHandler:
     Класс, обслуживающий конкретного клиента. Получает запросы, обрабатывает их, отправляет ответы.
     """
 
-    def __init__(self, client_socket, client_addr):
+    def __init__(self, client_socket, client_addr, cache_manager=None):
         self.client_socket = client_socket
         self.client_addr = client_addr
         self.logger = logging.getLogger("server_logger")
@@ -21,7 +21,8 @@ class ClientHandler:
         # Инициализация подсистем
         self.sql_parser = SqlParser()
         self.csv_manager = CSVManager()
-        self.cache_manager = CacheManager()
+        # Кэш общий для всех клиентов (передаётся сервером)
+        self.cache_manager = cache_manager if cache_manager is not None else CacheManager()
         self.auth_manager = AuthManager()  # Базовая аутентификация
 
         self.is_authenticated = False
@@ -115,15 +116,15 @@ class ClientHandler:
         cached_result = self.cache_manager.get_from_cache(query_info)
         if cached_result is not None:
             self.logger.info("Результат найден в кэше.")
-            return cached_result.encode('utf-8')
+            return cached_result
 
         # Выполняем чтение CSV
-        csv_result = self.csv_manager.select_from_csv(query_info)
+        csv_result = self.csv_manager.select_from_csv(query_info).encode('utf-8')
 
-        # Сохраняем в кэш
+        # Сохраняем в кэш (уже в байтах, чтобы не кодировать повторно)
         self.cache_manager.save_to_cache(query_info, csv_result)
 
-        return csv_result.encode('utf-8')
+        return csv_result
 
     def _send_message(self, message: bytes):
         """
@@ -32,44 +32,49 @@ class CSVManager:
         if not csv_files:
             raise FileNotFoundError(f"Нет CSV-файлов в таблице {table_name}.")
 
-        # Собираем все данные
+        # Если columns == ['*'] - значит выводим весь header (первого файла)
+        columns_to_write = None if columns == ["*"] else columns
+
+        # Строки храним как кортежи значений в порядке columns_to_write,
+        # а не как словари: для широких таблиц это заметно экономит память.
         results = []
-        header = None
+        # Словарь значений: одинаковые строки (возраст, цена, категория и т.п.)
+        # хранятся в памяти в одном экземпляре.
+        values_pool = {}
 
         for file_path in csv_files:
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                if header is None:
-                    header = reader.fieldnames
+            with open(file_path, "r", encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                file_header = next(reader, None)
+                if file_header is None:
+                    continue
+                if columns_to_write is None:
+                    columns_to_write = file_header
+
+                # Индексы нужных колонок в текущем файле (None — колонки нет)
+                positions = {col: i for i, col in enumerate(file_header)}
+                indexes = [positions.get(col) for col in columns_to_write]
+                where_index = positions.get(where["column"]) if where else None
+                if where and where_index is None:
+                    continue
 
                 for row in reader:
-                    if self._row_matches_condition(row, where):
-                        # Если columns = ["*"], берём всё
-                        if columns == ["*"]:
-                            results.append(row)
-                        else:
-                            # Берём только нужные колонки
-                            filtered_row = {col: row[col] for col in columns if col in row}
-                            results.append(filtered_row)
+                    if not row:
+                        continue
+                    if where and not self._value_matches_condition(
+                            self._cell(row, where_index), where):
+                        continue
+                    results.append(tuple(
+                        values_pool.setdefault(value, value)
+                        for value in (self._cell(row, i) for i in indexes)
+                    ))
 
         # Преобразуем results обратно в CSV-формат (строку)
         if not results:
             return "No data\n"
 
-        # Если columns == ['*'] - значит выводим весь header
-        if columns == ["*"]:
-            columns_to_write = header
-        else:
-            columns_to_write = columns
-
-        output_lines = []
-        output_lines.append(",".join(columns_to_write))
-
-        for r in results:
-            line = []
-            for c in columns_to_write:
-                line.append(r.get(c, ""))  # Если колонки нет, пустое
-            output_lines.append(",".join(line))
+        output_lines = [",".join(columns_to_write)]
+        output_lines.extend(",".join(r) for r in results)
 
         return "\n".join(output_lines) + "\n"
 
@@ -94,23 +99,24 @@ class CSVManager:
                 structure[table_name] = list(columns_set)
         return structure
 
-    def _row_matches_condition(self, row: dict, where: dict) -> bool:
+    @staticmethod
+    def _cell(row: list, index) -> str:
+        """
+        Значение ячейки по индексу; если колонки нет или строка короче — пустая строка.
+        """
+        if index is None or index >= len(row):
+            return ""
+        return row[index]
+
+    def _value_matches_condition(self, row_val_str: str, where: dict) -> bool:
         """
-        Проверяем, проходит ли строка под условие WHERE.
+        Проверяем, проходит ли значение колонки под условие WHERE.
         """
-        if not where:
-            return True
-        col = where["column"]
         op = where["operator"]
         val = where["value"]
 
-        if col not in row:
-            return False
-
         # Для простоты предположим, что все данные — строки,
         # попробуем приводить к float, если возможно.
-        row_val_str = row[col]
-
         # Пытаемся преобразовать оба в float, если не вышло — сравниваем как строки
         try:
             row_val = float(row_val_str)
@@ -3,6 +3,7 @@ import threading
 import logging
 
 from server.client_handler import ClientHandler
+from server.cache_manager import CacheManager
 from server.logger import setup_server_logger
 
 
@@ -18,6 +19,9 @@ class Server:
         self.backlog = backlog
         self.sock = None
 
+        # Общий кэш результатов для всех клиентов
+        self.cache_manager = CacheManager()
+
         # Инициализируем общий логгер для сервера
         setup_server_logger()  # Допустим, настроим logging
         self.logger = logging.getLogger("server_logger")
@@ -49,7 +53,7 @@ class Server:
         """
         Создаём экземпляр ClientHandler и передаём ему управление.
         """
-        handler = ClientHandler(client_socket, client_addr)
+        handler = ClientHandler(client_socket, client_addr, self.cache_manager)
         handler.run()
 
     def stop(self):